@@ -5,16 +5,34 @@ Creates 16x16, 48x48, and 128x128 pixel icons.
 
 Design: Bookmark/shield shape with deep blue background (#1e3a5f),
 interconnected neural network nodes in electric teal (#00d4aa),
-and prominent white "KB" text.
+and prominent white "KB" text. The "simple" style drops the neural
+network motif and renders only the shape and the KB text.
+
+Usage:
+    python3 generate_icons.py [--style {neural,simple}]
 """
 
+import argparse
+import functools
+import math
 import struct
+import sys
 import zlib
-import math
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: NumPy required. Install with: pip3 install numpy")
+    sys.exit(1)
 
 
 def create_png(width, height, pixels):
-    """Create a PNG image from raw pixel data."""
+    """Create a PNG image from raw RGBA pixel data.
+
+    ``pixels`` may be a flat bytes-like object or a uint8 array of shape
+    (height, width, 4).
+    """
 
     def make_chunk(chunk_type, data):
         chunk_len = struct.pack('>I', len(data))
@@ -28,15 +46,15 @@ def create_png(width, height, pixels):
     ihdr_data = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
     ihdr = make_chunk(b'IHDR', ihdr_data)
 
-    # IDAT chunk (image data)
-    raw_data = b''
-    for y in range(height):
-        raw_data += b'\x00'  # Filter byte (none)
-        for x in range(width):
-            idx = (y * width + x) * 4
-            raw_data += bytes(pixels[idx:idx + 4])
-
-    compressed = zlib.compress(raw_data, 9)
+    # IDAT chunk (image data): each scanline is filter type 0 (None)
+    # followed by the row's RGBA bytes; flat-color artwork deflates best
+    # unfiltered
+    rows = np.asarray(
+        pixels if isinstance(pixels, np.ndarray) else np.frombuffer(bytes(pixels), dtype=np.uint8),
+        dtype=np.uint8,
+    ).reshape(height, width * 4)
+    raw_data = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows])
+    compressed = zlib.compress(raw_data.tobytes(), 9)
     idat = make_chunk(b'IDAT', compressed)
 
     # IEND chunk
@@ -45,125 +63,203 @@ def create_png(width, height, pixels):
     return header + ihdr + idat + iend
 
 
-def blend_pixel(bg, fg, alpha):
-    """Blend foreground color over background with given alpha (0.0-1.0)."""
-    r = int(bg[0] * (1 - alpha) + fg[0] * alpha)
-    g = int(bg[1] * (1 - alpha) + fg[1] * alpha)
-    b = int(bg[2] * (1 - alpha) + fg[2] * alpha)
-    a = max(bg[3], int(alpha * 255))
-    return (min(255, r), min(255, g), min(255, b), min(255, a))
-
+ICON_STYLES = ('neural', 'simple')
+
+# --- Neural network nodes (normalized 0..1 coordinates) ---
+# Positions designed to sit behind the KB text as a subtle background motif
+NETWORK_NODES = np.array([
+    # Top area
+    (0.20, 0.15),
+    (0.50, 0.08),
+    (0.80, 0.15),
+    # Upper middle
+    (0.12, 0.35),
+    (0.88, 0.35),
+    # Middle
+    (0.15, 0.55),
+    (0.50, 0.50),
+    (0.85, 0.55),
+    # Lower
+    (0.25, 0.75),
+    (0.50, 0.72),
+    (0.75, 0.75),
+    # Bottom
+    (0.38, 0.88),
+    (0.62, 0.88),
+], dtype=np.float64)
+
+# Edges connecting nodes (index pairs)
+NETWORK_EDGES = np.array([
+    (0, 1), (1, 2),
+    (0, 3), (2, 4),
+    (3, 5), (4, 7),
+    (5, 6), (6, 7),
+    (1, 6),
+    (5, 8), (6, 9), (7, 10),
+    (8, 9), (9, 10),
+    (8, 11), (9, 11), (9, 12), (10, 12),
+    (11, 12),
+    (3, 6), (4, 6),
+], dtype=np.intp)
+
+# --- KB letter bitmaps (5x7 grid each) ---
+# K glyph on a 5x7 grid
+K_BITMAP = [
+    [1, 0, 0, 0, 1],
+    [1, 0, 0, 1, 0],
+    [1, 0, 1, 0, 0],
+    [1, 1, 0, 0, 0],
+    [1, 0, 1, 0, 0],
+    [1, 0, 0, 1, 0],
+    [1, 0, 0, 0, 1],
+]
+
+# B glyph on a 5x7 grid
+B_BITMAP = [
+    [1, 1, 1, 1, 0],
+    [1, 0, 0, 0, 1],
+    [1, 0, 0, 0, 1],
+    [1, 1, 1, 1, 0],
+    [1, 0, 0, 0, 1],
+    [1, 0, 0, 0, 1],
+    [1, 1, 1, 1, 0],
+]
+
+# Full KB glyph grid: K in columns 0..4, empty gap column, B in columns 6..10
+KB_BITMAP = np.hstack([
+    np.array(K_BITMAP, dtype=np.uint8),
+    np.zeros((7, 1), dtype=np.uint8),
+    np.array(B_BITMAP, dtype=np.uint8),
+])
 
-def distance(x1, y1, x2, y2):
-    """Euclidean distance between two points."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
-
-def point_to_segment_distance(px, py, x1, y1, x2, y2):
-    """Distance from point (px,py) to line segment (x1,y1)-(x2,y2)."""
+def blend_pixel(bg, fg, alpha):
+    """Blend a foreground color over background channel arrays with per-pixel alpha."""
+    # Whole-layer fast paths: nothing to draw, or fully opaque foreground
+    if not alpha.any():
+        return bg
+    if (alpha >= 1).all():
+        return tuple(np.full(alpha.shape, c, dtype=np.float64) for c in fg)
+
+    # Channels and alpha are within 0..255 and 0..1, so the blend is a convex
+    # combination and never needs clamping
+    inv = 1 - alpha
+    r = np.floor(bg[0] * inv + fg[0] * alpha)
+    g = np.floor(bg[1] * inv + fg[1] * alpha)
+    b = np.floor(bg[2] * inv + fg[2] * alpha)
+    a = np.maximum(bg[3], np.floor(alpha * 255))
+    return (r, g, b, a)
+
+
+def squared_distance(x1, y1, x2, y2):
+    """Squared Euclidean distance between two points (scalars or arrays)."""
+    return (x2 - x1) ** 2 + (y2 - y1) ** 2
+
+
+def point_to_segment_squared_distance(px, py, x1, y1, x2, y2):
+    """Squared distance from points (px,py) to each segment (x1,y1)-(x2,y2).
+
+    ``px``/``py`` are point arrays of any shape and the endpoints are (E,)
+    arrays; the result has shape (E, *px.shape).
+    """
+    x1, y1, x2, y2 = (v.reshape(-1, *[1] * px.ndim) for v in (x1, y1, x2, y2))
+    px = px[None]
+    py = py[None]
     dx = x2 - x1
     dy = y2 - y1
     length_sq = dx * dx + dy * dy
-    if length_sq == 0:
-        return distance(px, py, x1, y1)
-    t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / length_sq))
+    # Degenerate (zero-length) segments project onto their first endpoint
+    t = np.clip(((px - x1) * dx + (py - y1) * dy) / np.where(length_sq == 0, 1, length_sq), 0, 1)
     proj_x = x1 + t * dx
     proj_y = y1 + t * dy
-    return distance(px, py, proj_x, proj_y)
+    return squared_distance(px, py, proj_x, proj_y)
 
 
-def create_kb_icon(size):
-    """Create the AgentMarKB icon at the specified size."""
-    pixels = []
+def point_to_segment_distance(px, py, x1, y1, x2, y2):
+    """Distance from points (px,py) to each segment (x1,y1)-(x2,y2), shape (E, *px.shape)."""
+    return np.sqrt(point_to_segment_squared_distance(px, py, x1, y1, x2, y2))
 
-    # Colors
-    bg_color = (30, 58, 95, 255)       # Deep blue #1e3a5f
-    teal = (0, 212, 170, 255)          # Electric teal #00d4aa
-    white = (255, 255, 255, 255)       # White #ffffff
-    transparent = (0, 0, 0, 0)
-    # A slightly lighter blue for the inner glow area
-    inner_blue = (35, 68, 110, 255)
 
-    s = size  # shorthand
+def bookmark_sdf(x, y, s):
+    """Signed distance from points (x,y) to the bookmark/shield outline (negative inside).
 
-    # Bookmark/shield shape parameters
-    # Rounded rectangle with a pointed notch at the bottom center
+    The shape is a rectangle with rounded top corners, plus a tail below it
+    that tapers to a point at the bottom center.
+    """
+    corner_radius = max(2, s // 7)
+    notch_depth = max(2, s // 7)
+    notch_half_width = max(3, s // 4)
+    body_bottom = s - notch_depth + 1
+
+    # Body: rounded-box distance, with the rounding applied to the top corners only
+    half_w = s / 2.0
+    half_h = body_bottom / 2.0
+    radius = np.where(y < half_h, corner_radius, 0.0)
+    qx = np.abs(x - half_w) - half_w + radius
+    qy = np.abs(y - half_h) - half_h + radius
+    body = (np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+            + np.minimum(np.maximum(qx, qy), 0) - radius)
+
+    # Tail: triangle from the body's bottom edge down to (s/2, s). It starts
+    # one pixel up inside the body so the seam between the two isn't an edge.
+    tail_top = body_bottom - 1
+    slope = notch_half_width / (s - body_bottom)
+    top_half_w = slope * (s - tail_top)
+    vx = np.array([half_w - top_half_w, half_w + top_half_w, half_w])
+    vy = np.array([tail_top, tail_top, s], dtype=np.float64)
+    tail_dist = point_to_segment_distance(
+        x, y, vx, vy, np.roll(vx, -1), np.roll(vy, -1)).min(axis=0)
+    in_tail = (y >= tail_top) & (y <= s) & (np.abs(x - half_w) <= slope * (s - y))
+    tail = np.where(in_tail, -tail_dist, tail_dist)
+
+    return np.minimum(body, tail)
+
+
+def bookmark_row_bounds(s):
+    """Per-row pixel span [left, right) of the bookmark/shield shape of size s.
+
+    Each row of the shape is a single horizontal interval, so the integer
+    pixel mask can be built from two size-length tables instead of testing
+    every pixel against the corner and notch geometry.
+    """
     corner_radius = max(2, s // 7)
-    # The notch at the bottom
     notch_depth = max(2, s // 7)
     notch_half_width = max(3, s // 4)
 
-    # --- Define neural network nodes (normalized 0..1 coordinates) ---
-    # Positions designed to sit behind the KB text as a subtle background motif
-    nodes_norm = [
-        # Top area
-        (0.20, 0.15),
-        (0.50, 0.08),
-        (0.80, 0.15),
-        # Upper middle
-        (0.12, 0.35),
-        (0.88, 0.35),
-        # Middle
-        (0.15, 0.55),
-        (0.50, 0.50),
-        (0.85, 0.55),
-        # Lower
-        (0.25, 0.75),
-        (0.50, 0.72),
-        (0.75, 0.75),
-        # Bottom
-        (0.38, 0.88),
-        (0.62, 0.88),
-    ]
-
-    # Edges connecting nodes (index pairs)
-    edges = [
-        (0, 1), (1, 2),
-        (0, 3), (2, 4),
-        (3, 5), (4, 7),
-        (5, 6), (6, 7),
-        (1, 6),
-        (5, 8), (6, 9), (7, 10),
-        (8, 9), (9, 10),
-        (8, 11), (9, 11), (9, 12), (10, 12),
-        (11, 12),
-        (3, 6), (4, 6),
-    ]
-
-    # Scale nodes to pixel coordinates
-    nodes = [(nx * s, ny * s) for (nx, ny) in nodes_norm]
+    left = np.zeros(s, dtype=np.int64)
+    right = np.full(s, s, dtype=np.int64)
+    for y in range(s):
+        if y > s - notch_depth:
+            # V-notch narrowing toward the bottom center
+            progress = (y - (s - notch_depth)) / max(1, notch_depth - 1)
+            left_bound = (s / 2.0 - notch_half_width) + progress * notch_half_width
+            right_bound = (s / 2.0 + notch_half_width) - progress * notch_half_width
+            left[y] = max(0, math.ceil(left_bound))
+            right[y] = max(left[y], min(s, math.floor(right_bound) + 1))
+        elif y < corner_radius:
+            # Rounded top corners: widest integer offset still inside the arc
+            dy = corner_radius - y
+            reach = math.isqrt(corner_radius * corner_radius - dy * dy)
+            left[y] = corner_radius - reach
+            right[y] = s - corner_radius + reach
+    return left, right
 
-    # Node and edge sizing
-    node_radius = max(1.0, s * 0.035)
-    edge_width = max(0.5, s * 0.015)
 
-    # --- KB letter bitmaps (5x7 grid each) ---
-    # K glyph on a 5x7 grid
-    K_bitmap = [
-        [1, 0, 0, 0, 1],
-        [1, 0, 0, 1, 0],
-        [1, 0, 1, 0, 0],
-        [1, 1, 0, 0, 0],
-        [1, 0, 1, 0, 0],
-        [1, 0, 0, 1, 0],
-        [1, 0, 0, 0, 1],
-    ]
-
-    # B glyph on a 5x7 grid
-    B_bitmap = [
-        [1, 1, 1, 1, 0],
-        [1, 0, 0, 0, 1],
-        [1, 0, 0, 0, 1],
-        [1, 1, 1, 1, 0],
-        [1, 0, 0, 0, 1],
-        [1, 0, 0, 0, 1],
-        [1, 1, 1, 1, 0],
-    ]
-
-    # Letter rendering parameters
-    # KB occupies roughly the central area
-    kb_total_grid_w = 5 + 1 + 5  # K(5) + gap(1) + B(5) = 11 columns
-    kb_grid_h = 7
+def get_bookmark_alpha(x, y, s):
+    """Return bookmark coverage per pixel (1.0 inside, 0.0 outside)."""
+    if s <= 16:
+        # Small icons stay crisp: hard pixel mask, no anti-aliasing.
+        # x/y are the full pixel grid, so rows of x line up with the row tables
+        left, right = bookmark_row_bounds(s)
+        return ((x >= left[:, None]) & (x < right[:, None])).astype(np.float64)
+
+    # Analytic anti-aliasing: coverage from the signed distance at the pixel center
+    return np.clip(0.5 - bookmark_sdf(x + 0.5, y + 0.5, s), 0.0, 1.0)
+
+
+def is_in_kb_letter(x, y, s):
+    """Return alpha (0.0 or 1.0) for pixels that are part of the KB text."""
+    kb_grid_h, kb_total_grid_w = KB_BITMAP.shape  # K(5) + gap(1) + B(5) = 11 columns
 
     # Scale: each grid cell is this many pixels
     cell_size = max(1.0, s * 0.065)
@@ -174,170 +270,172 @@ def create_kb_icon(size):
     kb_offset_x = (s - kb_pixel_w) / 2.0
     kb_offset_y = (s - kb_pixel_h) / 2.0 - s * 0.02  # nudge up slightly
 
-    def is_in_bookmark_shape(x, y):
-        """Check if pixel (x,y) is inside the bookmark/shield shape."""
-        # Basic bounds
-        if x < 0 or x >= s or y < 0 or y >= s:
-            return False
+    # Map pixels to grid coordinates
+    gx = (x - kb_offset_x) / cell_size
+    gy = (y - kb_offset_y) / cell_size
+    on_grid = (gx >= 0) & (gx < kb_total_grid_w) & (gy >= 0) & (gy < kb_grid_h)
+
+    gi_x = np.clip(gx.astype(np.int64), 0, kb_total_grid_w - 1)
+    gi_y = np.clip(gy.astype(np.int64), 0, kb_grid_h - 1)
+    return np.where(on_grid & (KB_BITMAP[gi_y, gi_x] > 0), 1.0, 0.0)
+
+
+def get_node_alpha(x, y, nodes, node_radius):
+    """Return alpha for neural network nodes at each pixel."""
+    if len(nodes) == 0:
+        return np.zeros(x.shape, dtype=np.float64)
+    nx, ny = (v.reshape(-1, *[1] * x.ndim) for v in (nodes[:, 0], nodes[:, 1]))
+    d_sq = squared_distance(x[None], y[None], nx, ny)
+
+    # Most pixels are beyond every node's reach: test against the squared
+    # radius and only take square roots for the few that are within it
+    alpha = np.zeros_like(d_sq)
+    near = d_sq < (node_radius + 1.0) ** 2
+    d = np.sqrt(d_sq[near])
+    # Smooth falloff inside the node, anti-aliased rim just outside it
+    alpha[near] = np.where(d < node_radius, 1.0 - d / node_radius, (node_radius + 1.0 - d) * 0.5)
+    return np.minimum(1.0, alpha.max(axis=0))
+
+
+def get_edge_alpha(x, y, segments, edge_width):
+    """Return alpha for neural network edges (an (E, 2, 2) endpoint array) at each pixel."""
+    if len(segments) == 0:
+        return np.zeros(x.shape, dtype=np.float64)
+    n1 = segments[:, 0]
+    n2 = segments[:, 1]
+    d_sq = point_to_segment_squared_distance(x, y, n1[:, 0], n1[:, 1], n2[:, 0], n2[:, 1])
+
+    # As for nodes, only pixels within the squared reach need a square root
+    alpha = np.zeros_like(d_sq)
+    near = d_sq < (edge_width + 0.8) ** 2
+    d = np.sqrt(d_sq[near])
+    alpha[near] = np.where(d < edge_width, 0.4 * (1.0 - d / edge_width),
+                           0.2 * (edge_width + 0.8 - d) / 0.8)
+    return np.minimum(1.0, alpha.max(axis=0))
+
+
+@functools.lru_cache(maxsize=8)
+def scaled_nodes(size):
+    """Network node positions in pixel coordinates for the given icon size, shape (N, 2)."""
+    nodes = NETWORK_NODES * size
+    nodes.flags.writeable = False
+    return nodes
+
+
+@functools.lru_cache(maxsize=8)
+def edge_endpoints(size):
+    """Network edge endpoints in pixel coordinates for the given icon size, shape (E, 2, 2)."""
+    segments = scaled_nodes(size)[NETWORK_EDGES]
+    segments.flags.writeable = False
+    return segments
+
+
+def precompute_alpha_layers(size, nodes, segments, node_radius, edge_width):
+    """Compute the per-pixel alpha maps for every icon layer in one pass.
+
+    ``nodes`` is an (N, 2) array of node centers and ``segments`` an (E, 2, 2)
+    array of edge endpoints, both in pixel coordinates. Returns
+    ``(node_alpha, edge_alpha, kb_alpha, shape_alpha)`` as (size, size) float
+    arrays. ``shape_alpha`` is the bookmark's per-pixel coverage.
+    """
+    xs = np.arange(size, dtype=np.float64)
+    X, Y = np.meshgrid(xs, xs)
+    shape_alpha = get_bookmark_alpha(X, Y, size)
+
+    # Pixels outside the bookmark end up fully transparent, so evaluate the
+    # interior layers only at covered pixels and leave the margins at zero
+    covered = shape_alpha > 0
+    cx = X[covered]
+    cy = Y[covered]
+    layers = []
+    for values in (get_node_alpha(cx, cy, nodes, node_radius),
+                   get_edge_alpha(cx, cy, segments, edge_width),
+                   is_in_kb_letter(cx, cy, size)):
+        layer = np.zeros((size, size), dtype=np.float64)
+        layer[covered] = values
+        layers.append(layer)
+    return (*layers, shape_alpha)
+
+
+def create_kb_icon(size, style='neural'):
+    """Create the AgentMarKB icon at the specified size as a (size, size, 4) uint8 array.
+
+    ``style`` is ``'neural'`` (network motif behind the text) or ``'simple'``
+    (bookmark shape and KB text only).
+    """
+    if style not in ICON_STYLES:
+        raise ValueError(f"Unknown icon style: {style}")
 
-        # Top rounded rectangle part (extends to bottom minus notch area)
-        body_bottom = s - 1
+    # Colors
+    bg_color = (30, 58, 95, 255)       # Deep blue #1e3a5f
+    teal = (0, 212, 170, 255)          # Electric teal #00d4aa
+    white = (255, 255, 255, 255)       # White #ffffff
 
-        # Check notch: below (s - notch_depth), the shape narrows to a V
-        if y > s - notch_depth:
-            # V-notch: center is at s/2
-            # At y = s - notch_depth, full width
-            # At y = s - 1, narrows to a point at center
-            progress = (y - (s - notch_depth)) / max(1, notch_depth - 1)
-            # Left boundary moves toward center
-            left_bound = (s / 2.0 - notch_half_width) + progress * notch_half_width
-            right_bound = (s / 2.0 + notch_half_width) - progress * notch_half_width
-            if x < left_bound or x > right_bound:
-                return False
-            return True
-
-        # For the main body (above notch), check rounded rectangle
-        # Top-left corner
-        if x < corner_radius and y < corner_radius:
-            dx = corner_radius - x
-            dy = corner_radius - y
-            if dx * dx + dy * dy > corner_radius * corner_radius:
-                return False
+    s = size  # shorthand
 
-        # Top-right corner
-        if x >= s - corner_radius and y < corner_radius:
-            dx = x - (s - corner_radius - 1)
-            dy = corner_radius - y
-            if dx * dx + dy * dy > corner_radius * corner_radius:
-                return False
-
-        return True
-
-    def get_bookmark_edge_alpha(x, y):
-        """Return alpha for anti-aliased bookmark edge (1.0 inside, 0.0 outside)."""
-        # Simple: return 1.0 if inside, 0.0 if outside
-        # For smoother edges at larger sizes, check neighbors
-        if size <= 16:
-            return 1.0 if is_in_bookmark_shape(x, y) else 0.0
-
-        # Sub-pixel sampling for anti-aliasing (2x2)
-        count = 0
-        for sy in range(2):
-            for sx in range(2):
-                if is_in_bookmark_shape(x + sx * 0.5, y + sy * 0.5):
-                    count += 1
-        return count / 4.0
-
-    def is_in_kb_letter(x, y):
-        """Check if pixel is part of the KB text. Returns alpha 0.0-1.0."""
-        # Map pixel to grid coordinates for K
-        gx_k = (x - kb_offset_x) / cell_size
-        gy = (y - kb_offset_y) / cell_size
-
-        if 0 <= gy < kb_grid_h:
-            gi_y = int(gy)
-            if gi_y >= kb_grid_h:
-                gi_y = kb_grid_h - 1
-
-            # K letter (columns 0..4)
-            if 0 <= gx_k < 5:
-                gi_x = int(gx_k)
-                if gi_x >= 5:
-                    gi_x = 4
-                if K_bitmap[gi_y][gi_x]:
-                    return 1.0
-
-            # B letter (columns 6..10, i.e., offset by 6)
-            gx_b = gx_k - 6
-            if 0 <= gx_b < 5:
-                gi_x = int(gx_b)
-                if gi_x >= 5:
-                    gi_x = 4
-                if B_bitmap[gi_y][gi_x]:
-                    return 1.0
-
-        return 0.0
-
-    def get_node_alpha(x, y):
-        """Return alpha for neural network nodes at this pixel."""
-        best = 0.0
-        for (nx, ny) in nodes:
-            d = distance(x, y, nx, ny)
-            if d < node_radius:
-                # Smooth falloff
-                alpha = 1.0 - (d / node_radius)
-                best = max(best, alpha)
-            elif d < node_radius + 1.0:
-                # Anti-alias edge
-                alpha = (node_radius + 1.0 - d) * 0.5
-                best = max(best, alpha)
-        return min(1.0, best)
-
-    def get_edge_alpha(x, y):
-        """Return alpha for neural network edges at this pixel."""
-        best = 0.0
-        for (i, j) in edges:
-            n1 = nodes[i]
-            n2 = nodes[j]
-            d = point_to_segment_distance(x, y, n1[0], n1[1], n2[0], n2[1])
-            if d < edge_width:
-                alpha = 0.4 * (1.0 - d / edge_width)
-                best = max(best, alpha)
-            elif d < edge_width + 0.8:
-                alpha = 0.2 * (edge_width + 0.8 - d) / 0.8
-                best = max(best, alpha)
-        return min(1.0, best)
-
-    # --- Render each pixel ---
-    for y in range(s):
-        for x in range(s):
-            if not is_in_bookmark_shape(x, y):
-                # Check anti-aliased edge
-                edge_alpha = get_bookmark_edge_alpha(x, y)
-                if edge_alpha > 0:
-                    # Partially inside - blend bg with transparent
-                    pixel = (bg_color[0], bg_color[1], bg_color[2],
-                             int(edge_alpha * 255))
-                    pixels.extend(pixel)
-                else:
-                    pixels.extend(transparent)
-                continue
-
-            # Start with background
-            current = bg_color
-
-            # Layer 1: Neural network edges (subtle, behind everything)
-            edge_a = get_edge_alpha(x, y)
-            if edge_a > 0:
-                current = blend_pixel(current, teal, edge_a * 0.35)
-
-            # Layer 2: Neural network nodes (small dots)
-            node_a = get_node_alpha(x, y)
-            if node_a > 0:
-                current = blend_pixel(current, teal, node_a * 0.6)
-
-            # Layer 3: KB text on top (white, fully opaque where present)
-            kb_a = is_in_kb_letter(x, y)
-            if kb_a > 0:
-                current = blend_pixel(current, white, kb_a * 0.95)
-
-            pixels.extend(current)
-
-    return pixels
+    # Neural network in pixel coordinates (none for the simple style)
+    if style == 'simple':
+        nodes = np.empty((0, 2))
+        segments = np.empty((0, 2, 2))
+    else:
+        nodes = scaled_nodes(s)
+        segments = edge_endpoints(s)
+
+    # Node and edge sizing
+    node_radius = max(1.0, s * 0.035)
+    edge_width = max(0.5, s * 0.015)
+
+    node_a, edge_a, kb_a, shape_a = precompute_alpha_layers(
+        s, nodes, segments, node_radius, edge_width)
+
+    # --- Composite the layers ---
+    # Start with background
+    current = tuple(np.full((s, s), c, dtype=np.float64) for c in bg_color)
+
+    # Layer 1: Neural network edges (subtle, behind everything)
+    current = blend_pixel(current, teal, edge_a * 0.35)
+
+    # Layer 2: Neural network nodes (small dots)
+    current = blend_pixel(current, teal, node_a * 0.6)
+
+    # Layer 3: KB text on top (white, fully opaque where present)
+    current = blend_pixel(current, white, kb_a * 0.95)
+
+    # Clip to the bookmark: scale alpha by shape coverage, with fully
+    # uncovered pixels transparent
+    covered = shape_a > 0
+    r, g, b = (np.where(covered, channel, 0) for channel in current[:3])
+    a = np.floor(current[3] * shape_a)
+
+    return np.stack([r, g, b, a], axis=-1).astype(np.uint8)
+
+
+def build_icon(size, style='neural'):
+    """Render the icon at the given size and return the encoded PNG bytes."""
+    return create_png(size, size, create_kb_icon(size, style=style))
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate AgentMarKB extension icons')
+    parser.add_argument('--style', choices=ICON_STYLES, default='neural',
+                        help='Icon artwork style (default: neural)')
+    args = parser.parse_args()
+
     sizes = [16, 48, 128]
 
-    for size in sizes:
-        print(f"Generating {size}x{size} icon...")
-        pixels = create_kb_icon(size)
-        png_data = create_png(size, size, pixels)
+    # Render and compress all sizes concurrently; NumPy and zlib release the
+    # GIL for the heavy lifting, so threads overlap without process start-up cost
+    with ThreadPoolExecutor(max_workers=len(sizes)) as executor:
+        futures = {size: executor.submit(build_icon, size, args.style) for size in sizes}
+
+        for size in sizes:
+            print(f"Generating {size}x{size} icon...")
+            png_data = futures[size].result()
 
-        filename = f"icon{size}.png"
-        with open(filename, 'wb') as f:
-            f.write(png_data)
-        print(f"  Saved {filename}")
+            filename = f"icon{size}.png"
+            with open(filename, 'wb') as f:
+                f.write(png_data)
+            print(f"  Saved {filename}")
 
     print("\nAll icons generated successfully!")
 
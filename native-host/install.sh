@@ -40,6 +40,14 @@ else
     echo -e "${GREEN}[+]${NC} PyYAML installed"
 fi
 
+# The native host uses libyaml's C loader/dumper when PyYAML was built with it
+if python3 -c "import yaml, sys; sys.exit(0 if yaml.__with_libyaml__ else 1)" 2>/dev/null; then
+    echo -e "${GREEN}[+]${NC} PyYAML has libyaml support"
+else
+    echo -e "${YELLOW}[!]${NC} PyYAML was built without libyaml; large YAML files will load slowly."
+    echo "    Reinstall from a binary wheel: python3 -m pip install --force-reinstall --only-binary :all: pyyaml"
+fi
+
 # Make the host script executable
 chmod +x "$HOST_PATH"
 echo -e "${GREEN}[+]${NC} Made host script executable"
@@ -27,7 +27,8 @@ import hashlib
 from datetime import datetime, timezone
 from pathlib import Path
 
-# Try to import yaml, install if needed
+# Try to import yaml, install if needed (the PyYAML binary wheels bundle
+# libyaml, which provides the fast C loader/dumper used below)
 try:
     import yaml
 except ImportError:
@@ -35,31 +36,86 @@ except ImportError:
     subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'pyyaml', '--quiet'])
     import yaml
 
+# Prefer the libyaml-backed C implementations; fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Use orjson for the message boundary when available; fall back to stdlib json
+try:
+    import orjson
+
+    def dumps_json(obj):
+        """Serialize obj to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads_json(data):
+        """Parse UTF-8 JSON from a bytes-like object."""
+        return orjson.loads(data)
+except ImportError:
+    def dumps_json(obj):
+        """Serialize obj to UTF-8 JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
+
+    def loads_json(data):
+        """Parse UTF-8 JSON from a bytes-like object."""
+        return json.loads(str(data, 'utf-8'))
+
+
+# Unbuffered binary stdio: a message goes out in a single write with no
+# Python-side buffer to flush. closefd=False leaves fds 0/1 owned by sys.
+_stdin = os.fdopen(sys.stdin.fileno(), 'rb', buffering=0, closefd=False)
+_stdout = os.fdopen(sys.stdout.fileno(), 'wb', buffering=0, closefd=False)
+
+# Reusable receive buffer, grown on demand for larger messages
+_read_buffer = bytearray(65536)
+
+
+def read_fully(view):
+    """Fill a memoryview from stdin, returning the byte count (short only at EOF)."""
+    received = 0
+    while received < len(view):
+        n = _stdin.readinto(view[received:])
+        if not n:
+            break
+        received += n
+    return received
+
+
+def write_fully(data):
+    """Write all of data to stdout; usually a single write() on the pipe."""
+    view = memoryview(data)
+    while view:
+        view = view[_stdout.write(view):]
+
 
 def read_message():
     """Read a message from stdin using Chrome's native messaging protocol."""
+    global _read_buffer
+
     # Read the message length (first 4 bytes)
-    raw_length = sys.stdin.buffer.read(4)
-    if not raw_length:
+    if read_fully(memoryview(_read_buffer)[:4]) < 4:
         return None
 
     # Unpack the length as a little-endian unsigned int
-    message_length = struct.unpack('<I', raw_length)[0]
+    message_length = struct.unpack_from('<I', _read_buffer, 0)[0]
+    if message_length > len(_read_buffer):
+        _read_buffer = bytearray(message_length)
 
-    # Read the message
-    message = sys.stdin.buffer.read(message_length).decode('utf-8')
-    return json.loads(message)
+    # Read the message into the same buffer and parse it in place
+    view = memoryview(_read_buffer)[:message_length]
+    received = read_fully(view)
+    return loads_json(view[:received])
 
 
 def send_message(message):
     """Send a message to stdout using Chrome's native messaging protocol."""
     # Encode the message as JSON
-    encoded = json.dumps(message).encode('utf-8')
+    encoded = dumps_json(message)
 
-    # Write the message length followed by the message
-    sys.stdout.buffer.write(struct.pack('<I', len(encoded)))
-    sys.stdout.buffer.write(encoded)
-    sys.stdout.buffer.flush()
+    # Write the message length followed by the message in a single write
+    write_fully(struct.pack('<I', len(encoded)) + encoded)
 
 
 def read_yaml_file(file_path):
@@ -85,7 +141,7 @@ def read_yaml_file(file_path):
         # Lock for reading
         fcntl.flock(f.fileno(), fcntl.LOCK_SH)
         try:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
             return data if data else {}
         finally:
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -104,26 +160,52 @@ def write_yaml_file(file_path, data):
     # Write atomically using a temp file
     temp_path = path.with_suffix('.yaml.tmp')
 
-    with open(temp_path, 'w', encoding='utf-8') as f:
-        # Lock for writing
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-        try:
-            yaml.dump(
-                data,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-                indent=2,
-                width=120
-            )
-        finally:
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    if not write_linked_tmpfile(path.parent, temp_path, data):
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            dump_yaml(data, f)
 
     # Atomic rename
     os.replace(temp_path, path)
 
 
+def dump_yaml(data, f):
+    """Serialize the knowledge base to an open text file."""
+    yaml.dump(
+        data,
+        f,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        indent=2,
+        width=120
+    )
+
+
+def write_linked_tmpfile(directory, temp_path, data):
+    """Dump data to an anonymous O_TMPFILE file and link it in as temp_path.
+
+    The file only gets a name once it is fully written, so a crash mid-dump
+    never leaves a partial temp file behind. Returns False when O_TMPFILE or
+    /proc fd linking isn't available (e.g. on macOS) so the caller can fall
+    back to a regular temp file.
+    """
+    try:
+        fd = os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o666)
+    except (AttributeError, OSError):
+        return False
+
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        dump_yaml(data, f)
+        f.flush()
+        try:
+            temp_path.unlink(missing_ok=True)
+            os.link(f'/proc/self/fd/{fd}', temp_path)
+        except OSError:
+            return False
+    return True
+
+
 def test_connection(file_path):
     """Test if we can read/write to the specified file path."""
     path = Path(file_path).expanduser()
@@ -154,7 +236,7 @@ def test_connection(file_path):
             # Try to parse it as YAML
             try:
                 with open(path, 'r', encoding='utf-8') as f:
-                    yaml.safe_load(f)
+                    yaml.load(f, Loader=SafeLoader)
             except yaml.YAMLError as e:
                 result['errors'].append(f"Invalid YAML format: {str(e)}")
         else:
@@ -193,12 +275,12 @@ def create_bookmark(base_dir, slug, meta_yaml_str, content_md):
     assets_dir.mkdir(parents=True, exist_ok=True)
     canonicals_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write content.md
+    # Write content.md, encoding it once for both the file and its SHA-256
     content_path = assets_dir / 'content.md'
-    content_path.write_text(content_md, encoding='utf-8')
-
-    # Compute SHA-256 of content.md
-    sha256 = hashlib.sha256(content_md.encode('utf-8')).hexdigest()
+    content_bytes = content_md.encode('utf-8')
+    with open(content_path, 'wb') as f:
+        f.write(content_bytes)
+    sha256 = hashlib.sha256(content_bytes).hexdigest()
 
     # Update the sha256 placeholder in meta.yaml if present
     meta_yaml_str = meta_yaml_str.replace('SHA256_PLACEHOLDER', sha256)
@@ -7,19 +7,33 @@ their content, converts to Markdown, and creates the KB document folder
 structure in bookmarked_content/.
 
 Usage:
-    python3 migrate_bookmarks.py <path_to_curated_sources.yaml> [--dry-run]
+    python3 migrate_bookmarks.py <path_to_curated_sources.yaml> [--dry-run] [--workers N] [--refresh]
 
 Dependencies:
     pip3 install pyyaml requests readability-lxml markdownify
+
+Optional:
+    pip3 install requests-cache   # cache fetched pages between runs
+
+    Only pages served with a Content-Length of at most 4 MiB are cached.
+    Pages sent without one (chunked or compressed on the fly, as most
+    dynamic sites like Substack, X and LinkedIn do) are refetched each run.
 """
 
 import argparse
+import atexit
+import functools
 import hashlib
+import itertools
 import os
 import re
 import sys
-from datetime import datetime, timezone
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from pathlib import Path
+from urllib.parse import urlparse
 
 try:
     import yaml
@@ -27,193 +41,308 @@ except ImportError:
     print("ERROR: PyYAML required. Install with: pip3 install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml-backed C implementations; fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 try:
     import requests
 except ImportError:
     print("ERROR: requests required. Install with: pip3 install requests")
     sys.exit(1)
 
+# Optional: persistent HTTP cache so reruns revalidate instead of refetching
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 try:
     from readability import Document
+    from readability.htmls import build_doc, get_title
 except ImportError:
     print("ERROR: readability-lxml required. Install with: pip3 install readability-lxml")
     sys.exit(1)
 
 try:
-    from markdownify import markdownify as md
+    from markdownify import MarkdownConverter
 except ImportError:
     print("ERROR: markdownify required. Install with: pip3 install markdownify")
     sys.exit(1)
 
+# Installed alongside markdownify (beautifulsoup4) and readability-lxml (lxml)
+from bs4 import BeautifulSoup
+
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
 
+# Number of URLs fetched concurrently by default
+FETCH_WORKERS = 16
+
+# Pages are read up to this many bytes; anything beyond is truncated
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+
+def within_size_limit(response):
+    """Whether a response declares a Content-Length that fits MAX_RESPONSE_BYTES.
+
+    Responses without one (e.g. chunked) could be any size, so they don't fit.
+    """
+    try:
+        return int(response.headers['Content-Length']) <= MAX_RESPONSE_BYTES
+    except (KeyError, ValueError):
+        return False
+
+
+# One session shared by all fetches so connections (and TLS sessions) to
+# hosts that recur across bookmarks are kept alive and reused. With
+# requests-cache installed, responses also persist across runs in the user
+# cache directory and are revalidated with ETag / Last-Modified once stale.
+# Caching reads the whole body, so only pages with a declared Content-Length
+# within MAX_RESPONSE_BYTES are cached; the rest are streamed with the cap.
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        'agentmarkb_migration',
+        use_cache_dir=True,
+        cache_control=True,
+        expire_after=86400,
+        filter_fn=within_size_limit,
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+atexit.register(SESSION.close)
+
+# HTML-to-Markdown converter. Documents are parsed with lxml up front because
+# markdownify otherwise falls back to BeautifulSoup's pure-Python html.parser.
+MD_CONVERTER = MarkdownConverter(heading_style='ATX', code_language='')
+
+# Platforms whose authors keep saved_posts rather than saved_articles
+_POST_PLATFORMS = frozenset({'x', 'linkedin'})
+
+# Runs of characters that collapse to a single hyphen in folder slugs
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Fetches run on worker threads; serialize output so lines don't interleave
+_print_lock = threading.Lock()
+
+
+def log(message):
+    """Print a progress line, safe to call from any thread."""
+    with _print_lock:
+        print(message)
+
+
+def _iso_date(value):
+    """Normalize a published date (string, date or datetime) to YYYY-MM-DD, or ''."""
+    if not value:
+        return ''
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        return ''
 
-def generate_slug(title, url, date_published):
-    """Generate a slug for the bookmark folder name."""
-    date_str = None
-    if date_published:
-        try:
-            d = datetime.fromisoformat(date_published.replace('Z', '+00:00'))
-            date_str = d.strftime('%Y-%m-%d')
-        except (ValueError, TypeError):
-            pass
-    if not date_str:
-        date_str = datetime.now().strftime('%Y-%m-%d')
 
+@functools.lru_cache(maxsize=4096)
+def generate_slug(title, url, date_str):
+    """Generate a slug for the bookmark folder name, prefixed with date_str (YYYY-MM-DD)."""
     slug_text = title or ''
     if not slug_text:
-        from urllib.parse import urlparse
         slug_text = urlparse(url).path.replace('/', ' ')
 
     # Lowercase, replace non-alphanumeric with hyphens, collapse, trim
-    slug = re.sub(r'[^a-z0-9]+', '-', slug_text.lower()).strip('-')[:80]
+    slug = _SLUG_RE.sub('-', slug_text.lower()).strip('-')[:80]
     return f"{date_str}_{slug}"
 
 
-def escape_yaml_string(s):
-    """Escape a string for YAML double-quoted values."""
-    if not s:
-        return ''
-    return s.replace('\\', '\\\\').replace('"', '\\"')
+def dump_yaml(data):
+    """Serialize a metadata mapping to a YAML string.
+
+    Scalars are never folded, so each field stays on one line like the
+    extension's own meta.yaml / content.md output. The width is the largest
+    the C emitter accepts (it can't take float('inf')).
+    """
+    return yaml.dump(
+        data,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        indent=2,
+        width=2**31 - 1
+    )
 
 
 def build_meta_yaml(slug, title, tags, source_url, platform, author_name,
-                    source_name, date_published, date_bookmarked, sha256):
-    """Build meta.yaml content string."""
-    tags_yaml = '\n'.join(f'  - {t}' for t in tags) if tags else '  []'
-
-    return f'''doc_id: "{slug}"
-doc_type: "bookmark"
-title: "{escape_yaml_string(title)}"
-created_at: "{date_bookmarked}"
-updated_at: "{date_bookmarked}"
-language: "en"
-status: "final"
-visibility: "private"
-
-canonical:
-  path: "canonicals/retrieval.md"
-  generated_from: "assets/content.md"
-  generator: "kb_manager_migration"
-  generated_at: "{date_bookmarked}"
-
-source_of_truth:
-  path: "assets/content.md"
-  sha256: "{sha256}"
-
-assets:
-  - path: "assets/content.md"
-    media_type: "text/markdown"
-    sha256: "{sha256}"
-    created_at: "{date_bookmarked}"
-
-tags:
-{tags_yaml}
-
-relationships:
-  derived_from: []
-  related: []
-
-bookmark_metadata:
-  source_url: "{escape_yaml_string(source_url)}"
-  platform: "{platform}"
-  author_name: "{escape_yaml_string(author_name or '')}"
-  source_name: "{escape_yaml_string(source_name or '')}"
-  date_published: "{date_published or ''}"
-  date_bookmarked: "{date_bookmarked.split('T')[0] if 'T' in date_bookmarked else date_bookmarked}"
-'''
+                    source_name, date_published, date_bookmarked, bookmarked_day, sha256):
+    """Build meta.yaml content string.
+
+    date_bookmarked is the full ISO timestamp; bookmarked_day is its date part.
+    """
+    return dump_yaml({
+        'doc_id': slug,
+        'doc_type': 'bookmark',
+        'title': title or '',
+        'created_at': date_bookmarked,
+        'updated_at': date_bookmarked,
+        'language': 'en',
+        'status': 'final',
+        'visibility': 'private',
+        'canonical': {
+            'path': 'canonicals/retrieval.md',
+            'generated_from': 'assets/content.md',
+            'generator': 'kb_manager_migration',
+            'generated_at': date_bookmarked,
+        },
+        'source_of_truth': {
+            'path': 'assets/content.md',
+            'sha256': sha256,
+        },
+        'assets': [{
+            'path': 'assets/content.md',
+            'media_type': 'text/markdown',
+            'sha256': sha256,
+            'created_at': date_bookmarked,
+        }],
+        'tags': list(tags or []),
+        'relationships': {
+            'derived_from': [],
+            'related': [],
+        },
+        'bookmark_metadata': {
+            'source_url': source_url or '',
+            'platform': platform,
+            'author_name': author_name or '',
+            'source_name': source_name or '',
+            'date_published': str(date_published or ''),
+            'date_bookmarked': bookmarked_day,
+        },
+    })
 
 
 def build_content_md(title, source_url, author_name, source_name, platform,
                      date_published, date_bookmarked, tags, body_markdown, status='final'):
     """Build content.md with YAML frontmatter."""
-    tags_yaml = '\n'.join(f'  - {t}' for t in tags) if tags else '  []'
-
-    frontmatter = f'''---
-title: "{escape_yaml_string(title)}"
-source_url: "{escape_yaml_string(source_url)}"'''
-
+    frontmatter = {
+        'title': title or '',
+        'source_url': source_url or '',
+    }
     if author_name:
-        frontmatter += f'\nauthor: "{escape_yaml_string(author_name)}"'
+        frontmatter['author'] = author_name
     if source_name:
-        frontmatter += f'\nsource: "{escape_yaml_string(source_name)}"'
-
-    frontmatter += f'''
-platform: {platform}
-date_published: "{date_published or ''}"
-date_bookmarked: "{date_bookmarked}"
-status: "{status}"
-tags:
-{tags_yaml}
----'''
-
-    header = f'\n# {title}\n'
+        frontmatter['source'] = source_name
+    frontmatter['platform'] = platform
+    frontmatter['date_published'] = str(date_published or '')
+    frontmatter['date_bookmarked'] = date_bookmarked
+    frontmatter['status'] = status
+    frontmatter['tags'] = list(tags or [])
+
+    parts = ['---\n', dump_yaml(frontmatter), '---\n']
+
+    parts.append(f'# {title}\n')
     if source_name:
-        header += f'\n**Source:** [{source_name}]({source_url})'
+        parts.append(f'\n**Source:** [{source_name}]({source_url})')
     else:
-        header += f'\n**Source:** [{source_url}]({source_url})'
+        parts.append(f'\n**Source:** [{source_url}]({source_url})')
     if author_name:
-        header += f'\n**Author:** {author_name}'
+        parts.append(f'\n**Author:** {author_name}')
     if date_published:
-        header += f'\n**Published:** {date_published}'
-    header += '\n\n---\n'
+        parts.append(f'\n**Published:** {date_published}')
+    parts.append('\n\n---\n\n')
+    parts.append(body_markdown or '*No content extracted.*')
 
-    return frontmatter + header + '\n' + (body_markdown or '*No content extracted.*')
+    return ''.join(parts)
 
 
-def create_bookmark_folder(base_dir, slug, meta_yaml_str, content_md, dry_run=False):
-    """Create the KB document folder structure."""
-    doc_path = base_dir / slug
+def write_file(path, data):
+    """Write bytes to path with raw os-level calls, bypassing Python's file buffering."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def create_bookmark_folder(base_dir, slug, meta_yaml_bytes, content_bytes, existing, dry_run=False):
+    """Create the KB document folder structure.
 
-    if doc_path.exists():
-        print(f"  SKIP: Folder already exists: {slug}")
+    existing is the set of entry names already in base_dir; slug is added to
+    it once its folder has been created.
+    """
+    doc_path = os.path.join(base_dir, slug)
+
+    if slug in existing:
+        log(f"  SKIP: Folder already exists: {slug}")
         return False
 
     if dry_run:
-        print(f"  DRY-RUN: Would create {doc_path}")
+        log(f"  DRY-RUN: Would create {doc_path}")
         return True
 
-    assets_dir = doc_path / 'assets'
-    canonicals_dir = doc_path / 'canonicals'
-    assets_dir.mkdir(parents=True, exist_ok=True)
-    canonicals_dir.mkdir(parents=True, exist_ok=True)
+    assets_dir = os.path.join(doc_path, 'assets')
+    canonicals_dir = os.path.join(doc_path, 'canonicals')
+    os.makedirs(assets_dir, exist_ok=True)
+    os.makedirs(canonicals_dir, exist_ok=True)
 
     # Write content.md
-    content_path = assets_dir / 'content.md'
-    content_path.write_text(content_md, encoding='utf-8')
+    write_file(os.path.join(assets_dir, 'content.md'), content_bytes)
 
     # Write meta.yaml
-    meta_path = doc_path / 'meta.yaml'
-    meta_path.write_text(meta_yaml_str, encoding='utf-8')
+    write_file(os.path.join(doc_path, 'meta.yaml'), meta_yaml_bytes)
 
     # Create symlink
-    symlink_path = canonicals_dir / 'retrieval.md'
-    symlink_path.symlink_to('../assets/content.md')
+    os.symlink('../assets/content.md', os.path.join(canonicals_dir, 'retrieval.md'))
 
+    existing.add(slug)
     return True
 
 
+def read_capped_text(resp, limit):
+    """Read at most limit bytes of a streamed response body and decode it."""
+    chunks = []
+    total = 0
+    for chunk in resp.iter_content(64 * 1024):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return b''.join(chunks)[:limit].decode(resp.encoding or 'utf-8', errors='replace')
+
+
 def fetch_and_extract(url):
     """Fetch a URL and extract article content."""
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        doc = Document(resp.text)
-        title = doc.title()
-        content_html = doc.summary()
-        body_markdown = md(content_html, heading_style='ATX', code_language='')
+        with SESSION.get(url, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            html = read_capped_text(resp, MAX_RESPONSE_BYTES)
+        # Document.title() re-parses and fully cleans the page just to read
+        # <title>; a bare lxml parse is enough. summary() rewrites its own tree
+        # into the article, so the title can't be taken from it afterwards.
+        title = get_title(build_doc(html)[0])
+        content_html = Document(html).summary(html_partial=True)
+        body_markdown = MD_CONVERTER.convert_soup(BeautifulSoup(content_html, 'lxml'))
         return title, body_markdown, True
     except Exception as e:
-        print(f"  WARN: Failed to fetch {url}: {e}")
+        log(f"  WARN: Failed to fetch {url}: {e}")
         return None, None, False
 
 
 def collect_bookmarks(kb_data):
-    """Collect all saved articles/posts from the KB data."""
+    """Collect all saved articles/posts from the KB data.
+
+    A URL saved more than once (ignoring any fragment or trailing slash) is
+    only collected the first time it appears.
+    """
     bookmarks = []
+    seen = set()
 
     if not kb_data or 'favorite_authors' not in kb_data:
         return bookmarks
@@ -221,35 +350,38 @@ def collect_bookmarks(kb_data):
     for platform, authors in kb_data['favorite_authors'].items():
         if not isinstance(authors, list):
             continue
+        # Content key is the same for every author on a platform
+        content_key = 'saved_posts' if platform in _POST_PLATFORMS else 'saved_articles'
         for author in authors:
-            # Determine content key
-            content_key = 'saved_posts' if platform in ('x', 'linkedin') else 'saved_articles'
-            saved_content = author.get(content_key, [])
+            # Author name and source depend only on the author, not the item
+            if platform == 'x':
+                author_name = f"@{author.get('handle', '')}"
+                source_name = 'X (Twitter)'
+            elif platform == 'linkedin':
+                author_name = author.get('name', '')
+                source_name = 'LinkedIn'
+            elif platform == 'substack':
+                author_name = author.get('author', author.get('name', ''))
+                source_name = author.get('name', '')
+            else:
+                author_name = author.get('name', '')
+                source_name = author.get('source', '')
 
-            for item in saved_content:
+            for item in author.get(content_key, []):
                 url = item.get('url')
                 if not url:
                     continue
-
-                # Determine author name and source
-                if platform == 'x':
-                    author_name = f"@{author.get('handle', '')}"
-                    source_name = 'X (Twitter)'
-                elif platform == 'linkedin':
-                    author_name = author.get('name', '')
-                    source_name = 'LinkedIn'
-                elif platform == 'substack':
-                    author_name = author.get('author', author.get('name', ''))
-                    source_name = author.get('name', '')
-                else:
-                    author_name = author.get('name', '')
-                    source_name = author.get('source', '')
+                key = url.split('#')[0].rstrip('/')
+                if key in seen:
+                    continue
+                seen.add(key)
 
                 bookmarks.append({
                     'url': url,
                     'title': item.get('title', ''),
                     'summary': item.get('summary', item.get('preview', item.get('text', ''))),
                     'date_published': item.get('date_published', ''),
+                    'date_str': _iso_date(item.get('date_published')),
                     'topics': item.get('topics', []),
                     'platform': platform,
                     'author_name': author_name,
@@ -264,6 +396,11 @@ def main():
     parser.add_argument('yaml_path', help='Path to curated_sources.yaml')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without writing')
     parser.add_argument('--output-dir', help='Output directory (default: sibling bookmarked_content/)')
+    parser.add_argument('--workers', type=int, default=FETCH_WORKERS,
+                        help=f'Number of concurrent fetches (default: {FETCH_WORKERS})')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Clear the HTTP cache and refetch every URL (only pages '
+                             'served with a Content-Length up to 4 MiB are cached)')
     args = parser.parse_args()
 
     yaml_path = Path(args.yaml_path).expanduser()
@@ -293,73 +430,115 @@ def main():
         base_dir.mkdir(parents=True, exist_ok=True)
 
     # Read YAML
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        kb_data = yaml.safe_load(f)
+    with open(yaml_path, 'rb') as f:
+        kb_data = yaml.load(f, Loader=SafeLoader)
 
     bookmarks = collect_bookmarks(kb_data)
     print(f"Found {len(bookmarks)} bookmark(s) to migrate.\n")
 
-    now = datetime.now(timezone.utc).isoformat()
+    now_iso = datetime.now(timezone.utc).isoformat()
+    today_str = now_iso[:10]
     success = 0
     partial = 0
     skipped = 0
 
-    for i, bm in enumerate(bookmarks, 1):
-        print(f"[{i}/{len(bookmarks)}] {bm['title'] or bm['url']}")
-
-        # Fetch and extract
-        fetched_title, body_markdown, fetch_ok = fetch_and_extract(bm['url'])
-
-        title = bm['title'] or fetched_title or 'Untitled'
-        date_published = bm['date_published'] or ''
-        status = 'final' if fetch_ok else 'partial'
-
-        # Generate slug
-        slug = generate_slug(title, bm['url'], date_published)
-
-        # Build content.md
-        content_md = build_content_md(
-            title=title,
-            source_url=bm['url'],
-            author_name=bm['author_name'],
-            source_name=bm['source_name'],
-            platform=bm['platform'],
-            date_published=date_published,
-            date_bookmarked=now.split('T')[0],
-            tags=bm['topics'],
-            body_markdown=body_markdown,
-            status=status
-        )
-
-        # Compute SHA-256
-        sha256 = hashlib.sha256(content_md.encode('utf-8')).hexdigest()
-
-        # Build meta.yaml
-        meta_yaml = build_meta_yaml(
-            slug=slug,
-            title=title,
-            tags=bm['topics'],
-            source_url=bm['url'],
-            platform=bm['platform'],
-            author_name=bm['author_name'],
-            source_name=bm['source_name'],
-            date_published=date_published,
-            date_bookmarked=now,
-            sha256=sha256
-        )
-
-        # Create folder
-        created = create_bookmark_folder(base_dir, slug, meta_yaml, content_md, dry_run=args.dry_run)
-
-        if created:
-            if fetch_ok:
-                success += 1
-                print(f"  OK: Created {slug} (full content)")
-            else:
-                partial += 1
-                print(f"  OK: Created {slug} (metadata only, status: partial)")
-        else:
-            skipped += 1
+    if args.refresh and requests_cache is not None:
+        SESSION.cache.clear()
+
+    # List the output directory once; folder existence checks use this set
+    existing = set(os.listdir(base_dir)) if base_dir.is_dir() else set()
+
+    # A bookmark that has its own title gets a slug that doesn't depend on the
+    # fetched page, so an already-migrated one can be skipped before any HTTP
+    # work. Untitled bookmarks are still checked once the real slug is known.
+    to_fetch = []
+    for bm in bookmarks:
+        if bm['title']:
+            slug = generate_slug(bm['title'], bm['url'], bm['date_str'] or today_str)
+            if slug in existing:
+                log(f"SKIP: Folder already exists: {slug}")
+                skipped += 1
+                continue
+        to_fetch.append(bm)
+
+    workers = max(1, args.workers)
+    # Keep one pooled connection per worker for each host
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=workers)
+    SESSION.mount('http://', adapter)
+    SESSION.mount('https://', adapter)
+
+    # Fetch all URLs concurrently, but build and write the bookmarks on this
+    # thread in YAML order, so the first of several bookmarks sharing a slug
+    # always wins. Each result is dropped from the queue once it's written.
+    progress = itertools.count(1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque((bm, executor.submit(fetch_and_extract, bm['url'])) for bm in to_fetch)
+
+        try:
+            while pending:
+                bm, future = pending.popleft()
+                log(f"[{next(progress)}/{len(to_fetch)}] {bm['title'] or bm['url']}")
+                fetched_title, body_markdown, fetch_ok = future.result()
+
+                title = bm['title'] or fetched_title or 'Untitled'
+                date_published = bm['date_published'] or ''
+                status = 'final' if fetch_ok else 'partial'
+
+                # Generate slug
+                slug = generate_slug(title, bm['url'], bm['date_str'] or today_str)
+
+                # Build content.md
+                content_md = build_content_md(
+                    title=title,
+                    source_url=bm['url'],
+                    author_name=bm['author_name'],
+                    source_name=bm['source_name'],
+                    platform=bm['platform'],
+                    date_published=date_published,
+                    date_bookmarked=today_str,
+                    tags=bm['topics'],
+                    body_markdown=body_markdown,
+                    status=status
+                )
+
+                # Compute SHA-256
+                content_bytes = content_md.encode('utf-8')
+                sha256 = hashlib.sha256(content_bytes).hexdigest()
+
+                # Build meta.yaml
+                meta_yaml = build_meta_yaml(
+                    slug=slug,
+                    title=title,
+                    tags=bm['topics'],
+                    source_url=bm['url'],
+                    platform=bm['platform'],
+                    author_name=bm['author_name'],
+                    source_name=bm['source_name'],
+                    date_published=date_published,
+                    date_bookmarked=now_iso,
+                    bookmarked_day=today_str,
+                    sha256=sha256
+                )
+
+                # Create folder
+                created = create_bookmark_folder(
+                    base_dir, slug, meta_yaml.encode('utf-8'), content_bytes, existing,
+                    dry_run=args.dry_run
+                )
+
+                if created:
+                    if fetch_ok:
+                        success += 1
+                        log(f"  OK: Created {slug} (full content)")
+                    else:
+                        partial += 1
+                        log(f"  OK: Created {slug} (metadata only, status: partial)")
+                else:
+                    skipped += 1
+        except KeyboardInterrupt:
+            # Drop the queued fetches instead of letting shutdown wait for them
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     print(f"\nDone! Created: {success} full, {partial} partial, {skipped} skipped")
 